@@ -29,6 +29,7 @@ from building_function_helper import (
     demolisher_location_helper,
     coordinate_path_location_helper,
     find_paths_through_coordinates,
+    find_path_to_edge_cached,
 )
 
 from defense import Defense
@@ -438,7 +439,7 @@ class AlgoStrategy(gamelib.AlgoCore):
         interceptor_loc = coordinate_path_location_helper(game_state, w_region_coords)
         if interceptor_loc is not None:
             num_interceptors = math.floor(game_state.number_affordable(INTERCEPTOR))
-            OffensiveInterceptorSpam().build_interceptor_spam_single_loc(
+            OffensiveInterceptorSpam.build_interceptor_spam_single_loc(
                 game_state,
                 self.UNIT_ENUM_MAP,
                 num_interceptors,
@@ -668,7 +669,7 @@ class AlgoStrategy(gamelib.AlgoCore):
         )
         # finds all possible paths from starting coordinates
         all_possible_paths = {
-            tuple(coord): game_state.find_path_to_edge(coord)
+            tuple(coord): find_path_to_edge_cached(game_state, coord)
             for coord in self.our_defense.spawn_coordinates
         }
         # Remove all paths with length less than or equal to 3
@@ -855,7 +856,7 @@ class AlgoStrategy(gamelib.AlgoCore):
             "TRYING TO PLACE DEMOLISHERS AT: "
             + str([demolisher_x_coord, demolisher_y_coord])
         )
-        OffensiveDemolisherLine().build_demolisher_line(
+        OffensiveDemolisherLine.build_demolisher_line(
             game_state,
             self.UNIT_ENUM_MAP,
             num_demolishers,
@@ -1,6 +1,6 @@
 """This file contains functions to help determing WHERE to place a new unit"""
 
-from collections import Counter
+import numpy as np
 
 import gamelib
 from gamelib.game_state import GameState
@@ -14,6 +14,55 @@ FACTORY_ROW_MAX = 6  # Stops building factories once we hit this row
 # Enforced to not choose a spawn loc resulting in too short of a path
 MIN_PATH_LENGTH = 5
 
+# Paths found this turn, dropped whenever the map or its structures change
+_path_cache = {"game_map": None, "version": -1, "paths": {}}
+# Our bottom edge locations never change during a game, so they're only computed once
+_our_spawn_locations = None
+
+
+def find_path_to_edge_cached(game_state: GameState, location: [int]) -> [[int]]:
+    """Same as game_state.find_path_to_edge(location), but reuses the path from an earlier call
+    as long as no structure has been added or removed since
+
+    Args:
+        game_state (GameState): The current game state object
+        location: The starting location of the mobile unit
+
+    Returns:
+        path ([[int]]): The path to the edge, or None if the location is blocked
+    """
+
+    g_map = game_state.game_map
+    if _path_cache["game_map"] is not g_map or _path_cache["version"] != g_map.version:
+        _path_cache["game_map"] = g_map
+        _path_cache["version"] = g_map.version
+        _path_cache["paths"] = {}
+
+    paths = _path_cache["paths"]
+    key = (location[0], location[1])
+    if key not in paths:
+        paths[key] = game_state.find_path_to_edge(location)
+    return paths[key]
+
+
+def our_spawn_locations(game_map: GameMap) -> tuple:
+    """Returns every location on our bottom left and bottom right edges
+
+    Args:
+        game_map (GameMap): Any game map, the edges are the same for all of them
+
+    Returns:
+        locations (tuple): Tuple of [x, y] edge locations
+    """
+
+    global _our_spawn_locations
+    if _our_spawn_locations is None:
+        _our_spawn_locations = tuple(
+            game_map.get_edge_locations(game_map.BOTTOM_LEFT)
+            + game_map.get_edge_locations(game_map.BOTTOM_RIGHT)
+        )
+    return _our_spawn_locations
+
 
 def factory_location_helper(game_state: GameState) -> (int, int):
     """Returns a location to place 1 Factory at (as back as possible) or None if impossible
@@ -28,19 +77,19 @@ def factory_location_helper(game_state: GameState) -> (int, int):
     # Bottom at (13, 0) and (14, 0).
     # Start at (13, 1) and (14, 1) and work up (every +1y, have +2x)
 
-    location = (13, 1)
+    # Blocked cells come straight from the map's structure array, kept up to date as structures change
+    _, structure_types = game_state.game_map.get_structure_arrays()
+    occupied = structure_types >= 0
+
     for row in range(1, FACTORY_ROW_MAX + 1):
         # Start at 1st row and go up to top of our half
         x_left_bound = 13 - row
         x_right_bound = 14 + row
 
-        for x in range(x_left_bound + 1, x_right_bound):
-            # Don't build at left or right edge (+1 offset)
-            blocked = game_state.contains_stationary_unit((x, row))
-            if not blocked:
-                location = (x, row)
-
-                return location
+        # Don't build at left or right edge (+1 offset)
+        free_xs = np.flatnonzero(~occupied[x_left_bound + 1 : x_right_bound, row])
+        if len(free_xs) > 0:
+            return x_left_bound + 1 + int(free_xs[0]), row
 
     return None
 
@@ -64,39 +113,28 @@ def demolisher_location_helper(
     if len(their_turrets) == 0:
         return None
 
-    y_coords = Counter()  # Maps point y-coord to count
-
-    for turret in their_turrets:
-        if turret.y <= 16:
-            # Only count if within front 3 rows
-            y_coords.update({turret.y: 1})
+    # One pass over the turrets for both coordinates
+    turret_coords = np.array(
+        [(turret.x, turret.y) for turret in their_turrets], dtype=np.int8
+    )
+    turret_xs = turret_coords[:, 0]
+    turret_ys = turret_coords[:, 1]
 
-    if sum(y_coords.values()) < MIN_FRONT_TURRET_DENSITY * len(their_turrets):
+    # Only count if within front 3 rows
+    front_ys = turret_ys[turret_ys <= 16]
+    if len(front_ys) < MIN_FRONT_TURRET_DENSITY * len(their_turrets):
         return None  # Their front 3 rows are not that concentrated
 
-    # Returns a list of tuples (elem, count)
-    highest_concentration = y_coords.most_common(1)[0]
-    highest_concentration_y = highest_concentration[0]
+    # Maps point y-coord to count, ties go to the row whose turret was seen first
+    y_counts = np.bincount(front_ys, minlength=game_state.ARENA_SIZE)
+    most_common_ys = front_ys[y_counts[front_ys] == y_counts.max()]
+    highest_concentration_y = int(most_common_ys[0])
 
-    # Find the left/right half with highest concentration
-    left_right_half_counter = Counter()
-    their_turrets_x_coord = [
-        turret.x for turret in their_turrets if turret.y == highest_concentration_y
-    ]
-
-    # Start at THEIR most concentrated row
-    x_left_bound = 13 - highest_concentration_y
-    x_right_bound = 14 + highest_concentration_y
-    for x in range(x_left_bound, x_right_bound + 1):
-        # Go through every x in the most concentrated row (if turret, count)
-
-        if x <= 13 and x in their_turrets_x_coord:
-            left_right_half_counter.update({"LEFT": 1})
-        elif x >= 14 and x in their_turrets_x_coord:
-            left_right_half_counter.update({"RIGHT": 1})
-
-    most_conc_half = left_right_half_counter.most_common(1)[0]
-    left_half_more_conc = True if most_conc_half == "LEFT" else False
+    # Find the left/right half with highest concentration in THEIR most concentrated row
+    row_xs = turret_xs[turret_ys == highest_concentration_y]
+    left_count = np.count_nonzero(row_xs <= 13)
+    right_count = len(row_xs) - left_count
+    left_half_more_conc = bool(left_count >= right_count)
 
     return highest_concentration_y, left_half_more_conc
 
@@ -117,17 +155,13 @@ def coordinate_path_location_helper(
     """
 
     # Find where to place mobile unit to pass through 1 of those coords
-    loc = None
-
-    # Iterate through all possible spawn locations
-    g_map = game_state.game_map
-    possible_spawn_locs = g_map.get_edge_locations(
-        g_map.BOTTOM_LEFT
-    ) + g_map.get_edge_locations(g_map.BOTTOM_RIGHT)
+    # Coordinates are lists, so hash them as tuples for quick membership checks
+    desired_set = frozenset((c[0], c[1]) for c in desired_coordinates)
 
     if paths is None:
-        for spawn_loc in possible_spawn_locs:
-            path = game_state.find_path_to_edge(spawn_loc)
+        # Iterate through all possible spawn locations
+        for spawn_loc in our_spawn_locations(game_state.game_map):
+            path = find_path_to_edge_cached(game_state, spawn_loc)
 
             # Starting point was blocked by stationary unit
             if path is None:
@@ -137,22 +171,15 @@ def coordinate_path_location_helper(
             if len(path) < MIN_PATH_LENGTH:
                 continue
 
-            # Need to do this ugly hack because "path" is not hashable
-            for coord in desired_coordinates:
-                for path_coord in path:
-                    if coord[0] == path_coord[0] and coord[1] == path_coord[1]:
-                        # This path goes through the desired coordinates at least once
-                        loc = path[0]
-                        break
+            if not desired_set.isdisjoint((p[0], p[1]) for p in path):
+                # This path goes through the desired coordinates at least once
+                return path[0]
     else:
         for path in paths:
-            for coord in desired_coordinates:
-                for path_coord in path:
-                    if coord[0] == path_coord[0] and coord[1] == path_coord[1]:
-                        # This path goes through the desired coordinates at least once
-                        loc = path[0]
-                        break
-    return loc
+            if not desired_set.isdisjoint((p[0], p[1]) for p in path):
+                # This path goes through the desired coordinates at least once
+                return path[0]
+    return None
 
 
 def find_paths_through_coordinates(paths: list, desired_coordinates: [[]]):
@@ -163,17 +190,12 @@ def find_paths_through_coordinates(paths: list, desired_coordinates: [[]]):
     @return: list of satisfying paths
     """
 
+    desired_set = frozenset((c[0], c[1]) for c in desired_coordinates)
+
     valid_paths = []
     for path in paths:
-        found = False
-        for path_coord in path:
-            if found:
-                break
-            for coord in desired_coordinates:
-                if coord[0] == path_coord[0] and coord[1] == path_coord[1]:
-                    # This path goes through the desired coordinates at least once
-                    valid_paths.append(path)
-                    found = True
-                    break
+        if not desired_set.isdisjoint((p[0], p[1]) for p in path):
+            # This path goes through the desired coordinates at least once
+            valid_paths.append(path)
 
     return valid_paths
@@ -14,6 +14,9 @@ class Defense:
     PERCENT_TO_REBUILD_TURRET = 0.75  # Threshold for above
     PERCENT_TO_REBUILD_WALL = 0.75  # Threshold for above
 
+    # Maps a turret's reach to the (x, y) offsets of every cell in range of it
+    DAMAGE_STAMPS = {}
+
     def __init__(self, unit_enum_map: dict, player_id: int):
         """
         Initializes defense with multiple predetermined regions.
@@ -24,7 +27,8 @@ class Defense:
         self.regions = {}
         self.region_count = 6
         self.player_id = player_id
-        self.damage_regions = np.zeros(shape=(28, 14))
+        # damage is always a small sum of whole numbers, so float32 holds it exactly at half the size
+        self.damage_regions = np.zeros(shape=(28, 14), dtype=np.float32)
         self.grid_unit = np.full(shape=(28, 14), fill_value=None)
         if player_id == 0:
             self.create_our_regions(unit_enum_map)
@@ -228,35 +232,14 @@ class Defense:
         @return: list of lattice points along the edge
         """
 
-        start = edge[0]
-        finish = edge[1]
-        if finish[0] < start[0]:
-            start, finish = finish, start
-
-        # if the line is vertical
-        if start[0] == finish[0]:
-            return [
-                (start[0], min(start[1], finish[1]) + i)
-                for i in range(abs(finish[1] - start[1]) + 1)
-            ]
-
-        # line is horizontal
-        if start[1] == finish[1]:
-            return [
-                (min(start[0], finish[0]) + i, start[1])
-                for i in range(abs(finish[0] - start[0]) + 1)
-            ]
-
-        # line is upwards sloping
-        if finish[1] - start[1] > 0:
-            return [
-                (start[0] + i, start[1] + i) for i in range(finish[1] - start[1] + 1)
-            ]
-        # line is downward sloping
-        else:
-            return [
-                (start[0] + i, start[1] - i) for i in range(start[1] - finish[1] + 1)
-            ]
+        # walk from the lower left endpoint, one step per lattice point (edges are straight or 45 degrees)
+        start, finish = sorted((tuple(edge[0]), tuple(edge[1])))
+        dx = (finish[0] > start[0]) - (finish[0] < start[0])
+        dy = (finish[1] > start[1]) - (finish[1] < start[1])
+        return [
+            (start[0] + dx * i, start[1] + dy * i)
+            for i in range(max(finish[0] - start[0], abs(finish[1] - start[1])) + 1)
+        ]
 
     def initialize_grid(self):
         """
@@ -302,24 +285,19 @@ class Defense:
             # find the states of region i
             region.calculate_region_states(unit_enum_map, units)
 
-        for x in range(game_state.ARENA_SIZE):
-            for y in range(
-                game_state.HALF_ARENA * self.player_id,
-                game_state.HALF_ARENA * (1 + self.player_id),
-            ):
-                if not game_state.game_map.in_arena_bounds((x, y)):
-                    continue
-                unit = game_state.game_map[x, y]
-                if not unit:
-                    continue
-                unit = unit[0]
-                if (
-                    unit.unit_type == unit_enum_map["WALL"]
-                    or unit.unit_type == unit_enum_map["TURRET"]
-                    or unit.unit_type == unit_enum_map["FACTORY"]
-                ):
-                    self.units[unit.unit_type].append(unit)
-                    self.grid_unit[self.offset_coord((x, y))] = unit
+        get_units = game_state.game_map.__getitem__
+        y_min = game_state.HALF_ARENA * self.player_id
+        y_max = y_min + game_state.HALF_ARENA
+        for x, y in game_state.game_map.valid_cells:
+            if not y_min <= y < y_max:
+                continue
+            unit = get_units((x, y))
+            if not unit:
+                continue
+            unit = unit[0]
+            if unit.stationary:
+                self.units[unit.unit_type].append(unit)
+                self.grid_unit[self.offset_coord((x, y))] = unit
         self.recalculate_damage_regions = True
 
     def calculate_damage_regions(self, game_map: gamelib.GameMap, unit_enum_map):
@@ -328,6 +306,11 @@ class Defense:
         Describes the amount of damage a unit takes per frame in a specific location
         """
         if self.recalculate_damage_regions:
+            get_hit_radius = game_map.config["unitInformation"][0]["getHitRadius"]
+            width, height = self.damage_regions.shape
+            valid = self.grid_type != -1
+
+            self.damage_regions[:] = 0
             for turret in self.units[unit_enum_map["TURRET"]]:
                 if turret.upgraded:
                     damage = 15
@@ -335,13 +318,34 @@ class Defense:
                 else:
                     damage = 5
                     radius=2.5
-                for coord in game_map.get_locations_in_range(location=[turret.x, turret.y], radius=radius):
-                    offset_coord = self.offset_coord(coord)
-                    if self.grid_type[offset_coord] == -1 or offset_coord[1] > 13:
-                        continue
-                    self.damage_regions[offset_coord] += damage
+                # stamp the turret's range onto our half, offset into damage_regions coordinates
+                stamp = self.damage_stamp(radius + get_hit_radius)
+                xs = stamp[:, 0] + turret.x
+                ys = stamp[:, 1] + turret.y - 14 * self.player_id
+                on_half = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+                xs, ys = xs[on_half], ys[on_half]
+                in_range = valid[xs, ys]
+                self.damage_regions[xs[in_range], ys[in_range]] += damage
             self.recalculate_damage_regions = False
 
+    @staticmethod
+    def damage_stamp(reach: float) -> np.ndarray:
+        """
+        Gets the offsets of every cell within reach of a unit, same range test as game_map.get_locations_in_range
+        Only depends on the reach, so each one is only worked out the first time it's needed
+        @param reach: attack range plus the get hit radius
+        @return: (N, 2) int array of (x, y) offsets, shared so don't modify
+        """
+
+        if reach not in Defense.DAMAGE_STAMPS:
+            size = int(np.ceil(reach))
+            dxs, dys = np.mgrid[-size : size + 1, -size : size + 1]
+            in_range = np.sqrt(dxs**2 + dys**2) < reach
+            Defense.DAMAGE_STAMPS[reach] = np.stack(
+                [dxs[in_range], dys[in_range]], axis=1
+            )
+        return Defense.DAMAGE_STAMPS[reach]
+
     def get_damage_at_coord(self, coord):
         return self.damage_regions[self.offset_coord(coord)]
 
@@ -570,14 +574,11 @@ class Defense:
                     unit_enum_map, criteria=criteria, regions_to_consider=range(4)
                 )
 
-            gamelib.util.debug_write(
-                "WEAKEST REGION AT COUNT: "
-                + str(count)
-                + " is: "
-                + str(weakest_region)
-                + "; CURRENT SP IS: "
-                + str(game_state.get_resource(0, 0))
-            )
+            if gamelib.util.DEBUG:
+                gamelib.util.debug_write(
+                    f"WEAKEST REGION AT COUNT: {count} is: {weakest_region}"
+                    f"; CURRENT SP IS: {game_state.get_resource(0, 0)}"
+                )
             self.regions[weakest_region].fortify_region_defenses(
                 game_state, unit_enum_map
             )
@@ -6,12 +6,29 @@ from gamelib.unit import GameUnit
 
 from gamelib.util import debug_write
 
+# CONSTANTS
+
+# (x, y) offsets of the walls around a turret, indexed by (above << 2) | (left << 1) | right
+WALL_OFFSETS = (
+    (),
+    ((1, 0),),
+    ((-1, 0),),
+    ((-1, 0), (1, 0)),
+    ((0, 1),),
+    ((0, 1), (1, 0)),
+    ((0, 1), (-1, 0)),
+    ((0, 1), (-1, 0), (1, 0)),
+)
+ARENA_SIZE = 28
+# H_LINE_OFFSETS[length] holds the x offsets of a wall line with that length (a line can't be longer than the arena)
+H_LINE_OFFSETS = tuple(tuple(range(length)) for length in range(ARENA_SIZE + 1))
+
 
 class DefensiveWallStrat:
     """Contains builder/simulator for a line of horizontal walls"""
 
+    @staticmethod
     def build_h_wall_line(
-        self,
         game_state: GameState,
         unit_enum_map: dict,
         starting_location: (int, int) or [[int]],
@@ -28,34 +45,34 @@ class DefensiveWallStrat:
         Returns: List of locations where a wall was sucessfully places
         """
 
-        wall_placed_locs = []
-
-        if right:
-            locations = [
-                [starting_location[0] + i, starting_location[1]] for i in range(length)
-            ]
-
-            for loc in locations:
-                if game_state.can_spawn(unit_enum_map["WALL"], loc):
-                    succ = game_state.attempt_spawn(unit_enum_map["WALL"], loc)
-                    if succ == 1:
-                        wall_placed_locs.append(loc)
-
-        if not right:
-            locations = [
-                [starting_location[0] - i, starting_location[1]] for i in range(length)
-            ]
-
-            for loc in locations:
-                if game_state.can_spawn(unit_enum_map["WALL"], loc):
-                    succ = game_state.attempt_spawn(unit_enum_map["WALL"], loc)
-                    if succ == 1:
-                        wall_placed_locs.append(loc)
-
-        return wall_placed_locs
-
+        wall = unit_enum_map["WALL"]
+
+        # Can't afford a single wall, don't bother checking the locations
+        affordable = game_state.number_affordable(wall)
+        if affordable < 1:
+            return []
+
+        # Stop checking once there are as many valid locations as walls we can afford
+        can_spawn = game_state.can_spawn
+        start_x, y = starting_location[0], starting_location[1]
+        step = 1 if right else -1
+        valid_locations = []
+        for dx in H_LINE_OFFSETS[max(0, min(length, ARENA_SIZE))]:
+            loc = [start_x + step * dx, y]
+            if can_spawn(wall, loc):
+                valid_locations.append(loc)
+                if len(valid_locations) == affordable:
+                    break
+        if not valid_locations:
+            return []
+
+        # Every location was just checked, walls all cost the same so the ones built are the first few
+        built = game_state.attempt_spawn_unchecked(wall, valid_locations)
+
+        return valid_locations[:built]
+
+    @staticmethod
     def simulate_wall_line(
-        self,
         game_map: GameMap,
         unit_enum_map: dict,
         starting_location: (int, int) or [[int]],
@@ -73,30 +90,18 @@ class DefensiveWallStrat:
         @return: nothing
         """
 
-        if right:
-            locations = [
-                [starting_location[0] + i, starting_location[1]] for i in range(length)
-            ]
-
-            for loc in locations:
-                if not game_map[loc[0], loc[1]]:
-                    game_map.add_unit(unit_enum_map["WALL"], loc)
-
-        if not right:
-            locations = [
-                [starting_location[0] - i, starting_location[1]] for i in range(length)
-            ]
-
-            for loc in locations:
-                if not game_map[loc[0], loc[1]]:
-                    game_map.add_unit(unit_enum_map["WALL"], loc)
+        step = 1 if right else -1
+        for dx in H_LINE_OFFSETS[max(0, min(length, ARENA_SIZE))]:
+            loc = [starting_location[0] + step * dx, starting_location[1]]
+            if game_map.is_empty(loc[0], loc[1]):
+                game_map.add_unit(unit_enum_map["WALL"], loc)
 
 
 class DefensiveTurretWallStrat:
     """Contains builder/simulator for a turret paired with 1 or more walls"""
 
+    @staticmethod
     def build_turret_wall_pair(
-        self,
         game_state: GameState,
         unit_enum_map: dict,
         turret_location: (int, int) or [[int]],
@@ -120,39 +125,32 @@ class DefensiveTurretWallStrat:
 
         built = 0  # To return
 
-        wall_offsets = []
-        if above:
-            wall_offsets.append([0, 1])
-        if left:
-            wall_offsets.append([-1, 0])
-        if right:
-            wall_offsets.append([1, 0])
+        wall_offsets = WALL_OFFSETS[(above << 2) | (left << 1) | right]
+        wall_locations = [
+            [wo[0] + turret_location[0], wo[1] + turret_location[1]]
+            for wo in wall_offsets
+        ]
 
-        if not game_state.can_spawn(unit_enum_map["TURRET"], turret_location):
+        turret = unit_enum_map["TURRET"]
+        wall = unit_enum_map["WALL"]
+        if not game_state.can_spawn(turret, turret_location):
             return built
-        for wo in wall_offsets:
-            if not game_state.can_spawn(
-                unit_enum_map["WALL"],
-                [wo[0] + turret_location[0], wo[1] + turret_location[1]],
-            ):
+        for loc in wall_locations:
+            if not game_state.can_spawn(wall, loc):
                 return built
 
-        # Can build Turret and wall(s)
+        # Can build Turret and wall(s), locations were just checked so don't re-check them
 
-        built += game_state.attempt_spawn(unit_enum_map["TURRET"], turret_location)
+        built += game_state.attempt_spawn_unchecked(turret, turret_location)
 
         # Build the wall(s)
-        for wo in wall_offsets:
-            coord = [
-                wo[0] + turret_location[0],
-                wo[1] + turret_location[1],
-            ]
-            built += game_state.attempt_spawn(unit_enum_map["WALL"], coord)
+        if wall_locations:
+            built += game_state.attempt_spawn_unchecked(wall, wall_locations)
 
         return built
 
+    @staticmethod
     def simulate_turret_wall_pair(
-        self,
         game_map: GameMap,
         unit_enum_map: dict,
         turret_location: (int, int) or [[int]],
@@ -176,23 +174,15 @@ class DefensiveTurretWallStrat:
             upgrade_turret: Whether to upgrade the turret
         """
 
-        wall_offsets = []
-        if above:
-            wall_offsets.append([0, 1])
-        if left:
-            wall_offsets.append([-1, 0])
-        if right:
-            wall_offsets.append([1, 0])
+        wall_offsets = WALL_OFFSETS[(above << 2) | (left << 1) | right]
 
-        if not game_map[turret_location[0], turret_location[1]]:
+        if game_map.is_empty(turret_location[0], turret_location[1]):
             game_map.add_unit(unit_enum_map["TURRET"], turret_location)
         else:
             return  # Either add both or none
 
+        wall = unit_enum_map["WALL"]
         for wo in wall_offsets:
-            coord = [
-                wo[0] + turret_location[0],
-                wo[1] + turret_location[1],
-            ]
-            if not game_map[coord[0], coord[1]]:
-                game_map.add_unit(unit_enum_map["WALL"], [coord[0], coord[1]])
+            coord = [wo[0] + turret_location[0], wo[1] + turret_location[1]]
+            if game_map.is_empty(coord[0], coord[1]):
+                game_map.add_unit(wall, coord)
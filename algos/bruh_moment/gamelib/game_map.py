@@ -1,4 +1,5 @@
 import math
+import numpy as np
 from .unit import GameUnit
 from .util import debug_write
 
@@ -18,8 +19,16 @@ class GameMap:
         * TOP_LEFT (int): A constant that represents the top left edge
         * BOTTOM_LEFT (int): Hidden challenge! Can you guess what this constant represents???
         * BOTTOM_RIGHT (int): A constant that represents the bottom right edge
+        * version (int): Incremented every time a structure is added to or removed from the map
+        * structure_type_ids (dict): Maps each structure's shorthand to the id used by get_structure_arrays
+        * valid_cells (tuple): Every (x, y) location inside the arena, in x then y order
 
     """
+    # The board is the same for every map, so the valid locations and edges are only computed once
+    valid_cells = None
+    __edges = None
+    __bottom_edge_grid = None
+
     def __init__(self, config):
         """Initializes constants and game map
 
@@ -36,7 +45,20 @@ class GameMap:
         self.BOTTOM_LEFT = 2
         self.BOTTOM_RIGHT = 3
         self.__map = self.__empty_grid()
+        if GameMap.valid_cells is None:
+            GameMap.valid_cells = tuple(
+                (x, y) for x in range(self.ARENA_SIZE) for y in range(self.ARENA_SIZE) if self.in_arena_bounds((x, y))
+            )
         self.__start = [13,0]
+        self.version = 0
+        self.structure_type_ids = {}
+        if config is not None:
+            for i in range(3):
+                self.structure_type_ids[config["unitInformation"][i]["shorthand"]] = i
+        # Built on first use by get_structure_arrays/get_structures, then kept up to date by add_unit/remove_unit
+        self.__structure_players = None
+        self.__structure_types = None
+        self.__structures = None
     
     def __getitem__(self, location):
         if len(location) == 2 and self.in_arena_bounds(location):
@@ -47,6 +69,8 @@ class GameMap:
     def __setitem__(self, location, val):
         if type(location) == tuple and len(location) == 2 and self.in_arena_bounds(location):
             self.__map[location[0]][location[1]] = val
+            self.version += 1
+            self.__update_structure_arrays(location[0], location[1])
             return
         self._invalid_coordinates(location)
 
@@ -110,7 +134,7 @@ class GameMap:
             quadrant_description: A constant corresponding to one of the 4 edges. See game_map.TOP_LEFT, game_map.BOTTOM_RIGHT, and similar constants.
 
         Returns:
-            A list of locations along the requested edge
+            A list of locations along the requested edge. It is shared between calls, so don't modify it.
 
         """
         if not quadrant_description in [self.TOP_LEFT, self.TOP_RIGHT, self.BOTTOM_LEFT, self.BOTTOM_RIGHT]:
@@ -126,7 +150,31 @@ class GameMap:
         Returns:
             A list with four lists inside of it of locations corresponding to the four edges.
             [0] = top_right, [1] = top_left, [2] = bottom_left, [3] = bottom_right.
+            They are shared between calls, so don't modify them.
+        """
+        if GameMap.__edges is None:
+            GameMap.__edges = self.__build_edges()
+        return GameMap.__edges
+
+    def on_bottom_edge(self, location):
+        """Checks if a location is on our bottom left or bottom right edge
+
+        Args:
+            location: A location inside the arena
+
+        Returns:
+            True if mobile units can be deployed at that location
         """
+        if GameMap.__bottom_edge_grid is None:
+            # One byte per cell, indexed by y * ARENA_SIZE + x
+            grid = bytearray(self.ARENA_SIZE * self.ARENA_SIZE)
+            edges = self.get_edges()
+            for x, y in edges[self.BOTTOM_LEFT] + edges[self.BOTTOM_RIGHT]:
+                grid[y * self.ARENA_SIZE + x] = 1
+            GameMap.__bottom_edge_grid = grid
+        return GameMap.__bottom_edge_grid[location[1] * self.ARENA_SIZE + location[0]] == 1
+
+    def __build_edges(self):
         top_right = []
         for num in range(0, self.HALF_ARENA):
             x = self.HALF_ARENA + num
@@ -172,6 +220,8 @@ class GameMap:
             self.__map[x][y].append(new_unit)
         else:
             self.__map[x][y] = [new_unit]
+            self.version += 1
+            self.__update_structure_arrays(x, y)
 
     def remove_unit(self, location):
         """Remove all units on the map in the given location.
@@ -187,6 +237,71 @@ class GameMap:
         
         x, y = location
         self.__map[x][y] = []
+        self.version += 1
+        self.__update_structure_arrays(x, y)
+
+    def get_structure_arrays(self):
+        """Gets the owner and type of the structure on every location as two arrays
+
+        Returns:
+            Two ARENA_SIZE x ARENA_SIZE int8 arrays indexed by [x, y]: the player_index of the structure and its
+            type id (see structure_type_ids). Both are -1 where there is no structure. They are shared, so don't modify them.
+
+        """
+        if self.__structure_types is None:
+            self.__build_structure_index()
+        return self.__structure_players, self.__structure_types
+
+    def is_empty(self, x, y):
+        """Checks if there are no units at a location. Faster than game_map[x, y] for hot loops since it skips the bounds check
+
+        Args:
+            x: The x coordinate, must be inside the arena
+            y: The y coordinate, must be inside the arena
+
+        Returns:
+            True if there are no units at the location, False otherwise
+
+        """
+        return not self.__map[x][y]
+
+    def get_structures(self, player_index):
+        """Gets every structure owned by a player
+
+        Args:
+            player_index: The index corresponding to the player, 0 for you 1 for the enemy
+
+        Returns:
+            A dict mapping each (x, y) location holding one of the player's structures to that structure's GameUnit.
+            It is shared, so don't modify it.
+
+        """
+        if self.__structures is None:
+            self.__build_structure_index()
+        return self.__structures[player_index]
+
+    def __build_structure_index(self):
+        self.__structure_players = np.full((self.ARENA_SIZE, self.ARENA_SIZE), -1, dtype=np.int8)
+        self.__structure_types = np.full((self.ARENA_SIZE, self.ARENA_SIZE), -1, dtype=np.int8)
+        self.__structures = ({}, {})
+        for x, y in self.valid_cells:
+            if self.__map[x][y]:
+                self.__update_structure_arrays(x, y)
+
+    def __update_structure_arrays(self, x, y):
+        if self.__structure_types is None:
+            return
+        old_player = int(self.__structure_players[x, y])
+        if old_player >= 0:
+            del self.__structures[old_player][x, y]
+        units = self.__map[x][y]
+        if units and units[0].stationary:
+            self.__structure_players[x, y] = units[0].player_index
+            self.__structure_types[x, y] = units[0].unit_type_id
+            self.__structures[units[0].player_index][x, y] = units[0]
+        else:
+            self.__structure_players[x, y] = -1
+            self.__structure_types[x, y] = -1
 
     def get_locations_in_range(self, location, radius):
         """Gets locations in a circular area around a location
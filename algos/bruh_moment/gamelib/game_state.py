@@ -93,6 +93,7 @@ class GameState:
         self._shortest_path_finder = ShortestPathFinder()
         self._build_stack = []
         self._deploy_stack = []
+        self._type_costs = {}  # (unit_type, upgrade) -> [SP, MP], the config doesn't change mid game
         self._player_resources = [
                 {'SP': 0, 'MP': 0},  # player 0, which is you
                 {'SP': 0, 'MP': 0}]  # player 1, which is the opponent
@@ -295,12 +296,17 @@ class GameState:
         if unit_type == REMOVE:
             self._invalid_unit(unit_type)
             return
-        
+
+        key = (unit_type, upgrade)
+        if key in self._type_costs:
+            return self._type_costs[key]
+
         unit_def = self.config["unitInformation"][UNIT_TYPE_TO_INDEX[unit_type]]
         cost_base = [unit_def.get('cost1', 0), unit_def.get('cost2', 0)]
         if upgrade:
-            return [unit_def.get('upgrade', {}).get('cost1', cost_base[SP]), unit_def.get('upgrade', {}).get('cost2', cost_base[MP])]
+            cost_base = [unit_def.get('upgrade', {}).get('cost1', cost_base[SP]), unit_def.get('upgrade', {}).get('cost2', cost_base[MP])]
 
+        self._type_costs[key] = cost_base
         return cost_base
 
 
@@ -333,7 +339,7 @@ class GameState:
         stationary = is_stationary(unit_type)
         blocked = self.contains_stationary_unit(location) or (stationary and len(self.game_map[location[0],location[1]]) > 0)
         correct_territory = location[1] < self.HALF_ARENA
-        on_edge = location in (self.game_map.get_edge_locations(self.game_map.BOTTOM_LEFT) + self.game_map.get_edge_locations(self.game_map.BOTTOM_RIGHT))
+        on_edge = self.game_map.on_bottom_edge(location)
 
         if self.enable_warnings:
             fail_reason = ""
@@ -391,6 +397,39 @@ class GameState:
                     break
         return spawned_units
 
+    def attempt_spawn_unchecked(self, unit_type, locations):
+        """Spawns one unit of the type given at each of the given locations, without checking the locations.
+
+        Only use this with locations that are already known to be spawnable (in bounds, unblocked, on our side of the
+        map and on an edge for mobile units), e.g. ones filtered through can_spawn. Resources are still checked:
+        units are spawned in order until the next one can't be afforded.
+
+        Args:
+            unit_type: The type of unit we want to spawn
+            locations: A single location or list of locations to spawn units at
+
+        Returns:
+            The number of units successfully spawned
+
+        """
+        if unit_type not in ALL_UNITS:
+            self._invalid_unit(unit_type)
+            return
+        if type(locations[0]) == int:
+            locations = [locations]
+
+        costs = self.type_cost(unit_type)
+        stack = self._build_stack if is_stationary(unit_type) else self._deploy_stack
+        spawned_units = 0
+        for location in locations[:self.number_affordable(unit_type)]:
+            x, y = map(int, location)
+            self.__set_resource(SP, 0 - costs[SP])
+            self.__set_resource(MP, 0 - costs[MP])
+            self.game_map.add_unit(unit_type, location, 0)
+            stack.append((unit_type, x, y))
+            spawned_units += 1
+        return spawned_units
+
     def attempt_remove(self, locations):
         """Attempts to remove existing friendly structures in the given locations.
 
@@ -14,6 +14,7 @@ class GameUnit:
 
     Attributes :
         * unit_type (string): This unit's type
+        * unit_type_id (integer): This unit's type as its index in the config's unitInformation, structures are 0-2
         * config (JSON): Contains information about the game
         * player_index (integer): The player that controls this unit. 0 for you, 1 for your opponent.
         * x (integer): The x coordinate of the unit
@@ -48,7 +49,8 @@ class GameUnit:
 
     def __serialize_type(self):
         from .game_state import STRUCTURE_TYPES, UNIT_TYPE_TO_INDEX, FACTORY
-        type_config = self.config["unitInformation"][UNIT_TYPE_TO_INDEX[self.unit_type]]
+        self.unit_type_id = UNIT_TYPE_TO_INDEX[self.unit_type]
+        type_config = self.config["unitInformation"][self.unit_type_id]
         self.stationary = type_config["unitCategory"] == 0
         self.speed = type_config.get("speed", 0)
         self.damage_f = type_config.get("attackDamageTower", 0)
@@ -61,8 +63,7 @@ class GameUnit:
 
 
     def upgrade(self):
-        from .game_state import UNIT_TYPE_TO_INDEX
-        type_config = self.config["unitInformation"][UNIT_TYPE_TO_INDEX[self.unit_type]].get("upgrade", {})
+        type_config = self.config["unitInformation"][self.unit_type_id].get("upgrade", {})
         self.speed = type_config.get("speed", self.speed)
         self.damage_f = type_config.get("attackDamageTower", self.damage_f)
         self.damage_i = type_config.get("attackDamageWalker", self.damage_i)
@@ -3,6 +3,9 @@ import sys
 
 BANNER_TEXT = "---------------- Starting Your Algo --------------------"
 
+# Set to False to silence debug_write. Check it before building expensive debug messages
+DEBUG = True
+
 
 def get_command():
     """Gets input from stdin
@@ -36,6 +39,8 @@ def debug_write(*msg):
         msg: The message to output
 
     """
+    if not DEBUG:
+        return
     #Printing to STDERR is okay and printed out by the game but doesn't effect turns.
     sys.stderr.write(", ".join(map(str, msg)).strip() + "\n")
     sys.stderr.flush()
@@ -6,6 +6,12 @@ from gamelib.unit import GameUnit
 
 from gamelib.util import debug_write
 
+# Maps a resource name to the index get_resource expects
+RESOURCE_IDS = {"SP": 0, "MP": 1}
+
+# Results of get_structure_objects, dropped whenever the map or its structures change
+_structure_cache = {"game_map": None, "version": -1, "structures": {}}
+
 
 def are_losing(game_state: GameState) -> bool:
     """Returns whether or not we are losing. Function of health.
@@ -17,7 +23,7 @@ def are_losing(game_state: GameState) -> bool:
         losing (bool): Whether we are losing
     """
 
-    return game_state.my_health >= game_state.enemy_health
+    return game_state.my_health < game_state.enemy_health
 
 
 def health_differential(game_state: GameState) -> int:
@@ -45,10 +51,10 @@ def resource_differential(game_state: GameState, resource_type: str) -> int:
         differential (int): The differential between our and our opponent's given resource
     """
 
-    if resource_type == "MP":
-        return game_state.get_resource(1, 0) - game_state.get_resource(1, 1)
-    else:
-        return game_state.get_resource(0, 0) - game_state.get_resource(0, 1)
+    resource_id = RESOURCE_IDS.get(resource_type, 0)
+    return game_state.get_resource(resource_id, 0) - game_state.get_resource(
+        resource_id, 1
+    )
 
 
 def get_structure_objects(
@@ -70,41 +76,35 @@ def get_structure_objects(
     """
 
     board_map = game_state.game_map
-
-    our_structures = []
-
-    # Iterate over board and add to list if our unit
-    for x in range(board_map.ARENA_SIZE):
-        for y in range(board_map.ARENA_SIZE):
-            if not board_map.in_arena_bounds([x, y]):
-                continue
-
-            units = board_map[x, y]
-            if not units:
-                continue
-
-            # Only can have 1 structure on a tile
-            unit = units[0]
-
-            if player is not None:
-                # Desired specific player
-                if unit.player_index != player:
-                    continue  # Not the desired player's
-
-            if desired_structure_type is None:
-                # Add all types to list
-                if (
-                    unit.unit_type == unit_enum_map["TURRET"]
-                    or unit.unit_type == unit_enum_map["WALL"]
-                    or unit.unit_type == unit_enum_map["FACTORY"]
-                ):
-                    our_structures.append(unit)
-            else:
-                # Add only given type to list
-                if unit.unit_type == desired_structure_type:
-                    our_structures.append(unit)
-
-    return our_structures
+    if (
+        _structure_cache["game_map"] is not board_map
+        or _structure_cache["version"] != board_map.version
+    ):
+        _structure_cache["game_map"] = board_map
+        _structure_cache["version"] = board_map.version
+        _structure_cache["structures"] = {}
+
+    key = (desired_structure_type, player)
+    if key in _structure_cache["structures"]:
+        # Copy so callers can't change the cached list
+        return list(_structure_cache["structures"][key])
+
+    if player is None:
+        # Both players
+        by_location = {**board_map.get_structures(0), **board_map.get_structures(1)}
+    else:
+        # Desired specific player
+        by_location = board_map.get_structures(player)
+
+    # Only can have 1 structure on a tile, same x then y order as walking the board
+    structures = [by_location[loc] for loc in sorted(by_location)]
+    if desired_structure_type is not None:
+        # Only given type
+        type_id = board_map.structure_type_ids.get(desired_structure_type, -2)
+        structures = [unit for unit in structures if unit.unit_type_id == type_id]
+    _structure_cache["structures"][key] = structures
+
+    return list(structures)
 
 
 def get_structure_dict(game_state: GameState, unit_enum_map: dict, player: int) -> dict:
@@ -5,6 +5,7 @@ from gamelib.game_map import GameMap
 from gamelib.unit import GameUnit
 
 from defensive_building_functions import DefensiveWallStrat
+from building_function_helper import find_path_to_edge_cached
 
 from gamelib.util import debug_write
 
@@ -17,8 +18,8 @@ MIN_PATH_LENGTH = 5
 class OffensiveInterceptorSpam:
     """Contains builder/simulator for intercepter spam attack strategy"""
 
+    @staticmethod
     def build_interceptor_spam_multiple_locs(
-        self,
         game_state: GameState,
         unit_enum_map: dict,
         num_interceptors: int,
@@ -36,17 +37,28 @@ class OffensiveInterceptorSpam:
             built (int): Number of Interceptors actually successfully placed
         """
 
-        built = 0  # To return
+        if num_interceptors < 1 or not locations:
+            return 0
+        interceptor = unit_enum_map["INTERCEPTOR"]
+        budget = game_state.number_affordable(interceptor)
+        if budget < 1:
+            return 0
 
+        # Check each location once, stopping once the stacks use up what we can afford,
+        # then spawn every stack in one call (stops when we run out of MP)
+        stacked_locations = []
         for loc in locations:
-            built += self.build_interceptor_spam_single_loc(
-                game_state, unit_enum_map, num_interceptors, loc
-            )
+            if len(stacked_locations) >= budget:
+                break
+            if game_state.can_spawn(interceptor, loc):
+                stacked_locations += [loc] * num_interceptors
+        if not stacked_locations:
+            return 0
 
-        return built
+        return game_state.attempt_spawn_unchecked(interceptor, stacked_locations)
 
+    @staticmethod
     def build_interceptor_spam_single_loc(
-        self,
         game_state: GameState,
         unit_enum_map: dict,
         num_interceptors: int,
@@ -64,44 +76,24 @@ class OffensiveInterceptorSpam:
             built (int): Number of Interceptors actually successfully placed
         """
 
-        built = 0  # To return
-
-        for _ in range(num_interceptors):
-            if self._build_interceptor_helper(game_state, unit_enum_map, location):
-                built += 1
-
-        return built
-
-    def _build_interceptor_helper(
-        self,
-        game_state: GameState,
-        unit_enum_map: dict,
-        location: (int, int) or [int],
-    ) -> bool:
-        """Private helper to place an interceptor at a given location
-
-        Args:
-            game_state (GameState): The current GameState object
-            unit_enum_map (dict): Maps NAME to unit enum
-            location (int, int) or [int]: The (x, y) or [x, y] coordinates to place it at
-
-        Returns:
-            is_successful (bool): Whether the interceptor was able to be placed
-        """
-
-        if not game_state.can_spawn(unit_enum_map["INTERCEPTOR"], location):
-            return False
-
-        built = game_state.attempt_spawn(unit_enum_map["INTERCEPTOR"], location)
+        if num_interceptors < 1:
+            return 0
+        interceptor = unit_enum_map["INTERCEPTOR"]
+        # Stack as many as we can afford in a single spawn call
+        num_interceptors = min(
+            num_interceptors, game_state.number_affordable(interceptor)
+        )
+        if num_interceptors < 1 or not game_state.can_spawn(interceptor, location):
+            return 0
 
-        return True if built == 1 else False
+        return game_state.attempt_spawn(interceptor, location, num_interceptors)
 
 
 class OffensiveDemolisherLine:
     """Contains builder/simulator for Demolisher behind horizontal wall line strat"""
 
+    @staticmethod
     def build_demolisher_line(
-        self,
         game_state: GameState,
         unit_enum_map: dict,
         num_demolishers: int,
@@ -122,24 +114,26 @@ class OffensiveDemolisherLine:
         """
 
         # Build num_walls line towards right of location (might overflow but fine)
-        placed_wall_locs = DefensiveWallStrat().build_h_wall_line(
+        placed_wall_locs = DefensiveWallStrat.build_h_wall_line(
             game_state, unit_enum_map, wall_location, num_walls, right=right
         )
 
         # Offset coordinates one down or one left/right depending on where it places walls
-        path = game_state.find_path_to_edge(dem_location)
-        while dem_location[1] > 0 and (path is None or len(path) < MIN_PATH_LENGTH):
-            if right:
-                dem_location[0] += 1
-            else:
-                dem_location[0] -= 1
-            dem_location[1] -= 1
-            path = game_state.find_path_to_edge(dem_location)
-
-        # Build num_demolishers demolishers
-        for _ in range(num_demolishers):
-            game_state.attempt_spawn(unit_enum_map["DEMOLISHER"], dem_location)
+        # (paths are cached until the map changes, so retried positions skip the search)
+        dem_x, dem_y = dem_location
+        step = 1 if right else -1
+        path = find_path_to_edge_cached(game_state, [dem_x, dem_y])
+        while dem_y > 0 and (path is None or len(path) < MIN_PATH_LENGTH):
+            dem_x += step
+            dem_y -= 1
+            path = find_path_to_edge_cached(game_state, [dem_x, dem_y])
+
+        # Build num_demolishers demolishers, stacked in a single spawn call
+        if num_demolishers > 0:
+            game_state.attempt_spawn(
+                unit_enum_map["DEMOLISHER"], [dem_x, dem_y], num_demolishers
+            )
 
         # Mark all recently placed walls for deletion to not block our units/structures later
-        for placed_wall in placed_wall_locs:
-            game_state.attempt_remove(placed_wall)
+        if placed_wall_locs:
+            game_state.attempt_remove(placed_wall_locs)
@@ -1,9 +1,50 @@
 import gamelib
 import numpy as np
 import random
-import time
-import math
-import queue
+from collections import defaultdict, deque
+
+
+def bfs_predecessors(
+    cell_types: list, width: int, height: int, start: int, visited: list
+) -> (list, list):
+    """
+    Breadth First Search over a flattened region grid, where cell (x, y) lives at index x * height + y.
+    Kept free of any Region/GameUnit objects so the whole search only touches flat lists.
+    @param cell_types: flat list of cell types (-1: can't be walked through, 0: edge, 1: inside)
+    @param width: width of the region grid
+    @param height: height of the region grid
+    @param start: flat index to start the search from
+    @param visited: flat list of booleans, marked in place
+    @return: list of each cell's predecessor index (-1 if unreached), and the edge indices reached in order
+    """
+
+    predecessors = [-1] * (width * height)
+    reached_edges = []
+    frontier = deque([start])
+    visited[start] = True
+    while frontier:
+        s = frontier.popleft()
+        y = s % height
+
+        # above, below, right, left
+        adjacents = (
+            s + 1 if y + 1 < height else -1,
+            s - 1 if y > 0 else -1,
+            s + height if s + height < width * height else -1,
+            s - height,
+        )
+        for adj in adjacents:
+            if adj < 0 or visited[adj] or cell_types[adj] == -1:
+                continue
+
+            visited[adj] = True
+            predecessors[adj] = s
+            if cell_types[adj] == 0:
+                reached_edges.append(adj)
+            else:
+                frontier.append(adj)
+
+    return predecessors, reached_edges
 
 
 class Region:
@@ -12,6 +53,9 @@ class Region:
     MIN_TURN_UPGRADE = 5  # Only start upgrading after this turn
     MAX_TURRETS = 7  # Per Region
 
+    # Maps a tuple of vertices to what rasterize() returned for that polygon
+    RASTER_CACHE = {}
+
     def __init__(
         self,
         unit_enum_map: dict,
@@ -35,7 +79,6 @@ class Region:
         @param damage_regions: Numpy array representing the damage units take at a specific coordinate in the region
         """
         self.vertices = vertices
-        self.coordinates = set()
         self.player_id = player_id
         self.incoming_edges = incoming_edges
         self.outgoing_edges = outgoing_edges
@@ -55,46 +98,37 @@ class Region:
         )
         self.ywidth = self.ybounds[1] - self.ybounds[0] + 1
 
-        # each value in the grid looks like (int, units)
-        # the first # is the type of coordinate:
+        # each cell of the region is described by two parallel grids
+        # grid_type holds the type of coordinate:
         # -1: invalid coordinate, 0: edge, 1: inside
-        # the second is the stationary unit contained in the cell
-        # the [] operator accesses values from this grid
-        self.grid_type = np.full(
-            shape=(self.xwidth, self.ywidth), fill_value=-1, dtype=object
-        )
-        self.grid_unit = np.full(
-            shape=(self.xwidth, self.ywidth), fill_value=None, dtype=gamelib.GameUnit
-        )
+        # grid_unit maps a zeroed coordinate to the stationary unit in that cell (empty cells aren't stored)
+        # the [] operator accesses values from both grids
+        # the region polygons never change, so each one is only rasterized the first time it's seen
+        key = tuple(tuple(v) for v in vertices)
+        if key not in Region.RASTER_CACHE:
+            Region.RASTER_CACHE[key] = self.rasterize()
+        grid_type, all_boundaries, coordinates, tile_count, coordinate_array = Region.RASTER_CACHE[key]
+        self.grid_type = grid_type.copy()
+        self.grid_unit = {}
+        self.all_boundaries = all_boundaries
+        self.coordinates = set(coordinates)
+        self.tile_count = tile_count
+        # the same coordinates as one flat (N, 2) array for loops that visit every cell, shared so don't modify
+        self.coordinate_array = coordinate_array
+        # the lattice points of each edge as (x, y) tuples, they never change so they're only worked out once
+        self.edge_coords = {
+            edge: tuple((x, y) for x, y in self.edge_coordinates(edge).tolist())
+            for edge in self.edges
+        }
 
         # boolean to determine if we need to recalculate our paths from edge to edge based on new buildings being built
         self.recalculate_paths = True
         self.path_dict = {}
-        self.all_boundaries = set()
-        for i in range(len(vertices)):
-            for coord in self.edge_coordinates(
-                [vertices[i], vertices[(i + 1) % len(vertices)]]
-            ):
-                self.all_boundaries.add(coord)
-
-        for y in range(self.ybounds[0], self.ybounds[1] + 1):
-            for x in range(self.xbounds[0], self.xbounds[1] + 1):
-                if (x, y) in self.all_boundaries:
-                    self.grid_type[self.zero_coordinates((x, y))] = 0
-                    continue
-                if self.point_inside_polygon(x, y, vertices):
-                    self.coordinates.add((x, y))
-                    self.grid_type[self.zero_coordinates((x, y))] = 1
-
-        self.tile_count = len(self.coordinates)
-        # assigns edge coordinates to zero
-
-        self.coordinates = self.coordinates.union(self.all_boundaries)
-        for coord in self.all_boundaries:
-            self[coord][0] = 0
 
         # calculates the damage regions
-        self.damage_regions = np.full(shape=(self.xwidth, self.ywidth), fill_value=0)
+        self.damage_regions = np.zeros(
+            shape=(self.xwidth, self.ywidth), dtype=np.float32
+        )
 
         self.units = {
             unit_enum_map["TURRET"]: [],
@@ -105,6 +139,43 @@ class Region:
 
         # to access you must shift the coordinate with zero_coordinates
 
+    def rasterize(self) -> (np.array, set, set, int, np.array):
+        """
+        Works out which cells of the bounding box are edges or inside the region's polygon
+        @return: grid_type array, frozenset of boundary coordinates, set of all coordinates,
+        number of interior tiles and the coordinates as an (N, 2) array
+        """
+
+        vertices = self.vertices
+        grid_type = np.full(shape=(self.xwidth, self.ywidth), fill_value=-1, dtype=np.int8)
+        boundary = np.concatenate(
+            [
+                self.edge_coordinates([vertices[i], vertices[(i + 1) % len(vertices)]])
+                for i in range(len(vertices))
+            ]
+        )
+        all_boundaries = frozenset((x, y) for x, y in boundary.tolist())
+
+        # test every cell in the bounding box at once, indexed the same way as the grids
+        xs, ys = np.mgrid[
+            self.xbounds[0] : self.xbounds[1] + 1, self.ybounds[0] : self.ybounds[1] + 1
+        ]
+        boundary_mask = np.zeros(shape=(self.xwidth, self.ywidth), dtype=bool)
+        boundary_mask[boundary[:, 0] - self.xbounds[0], boundary[:, 1] - self.ybounds[0]] = True
+        inside_mask = self.point_inside_polygon(xs, ys, vertices) & ~boundary_mask
+
+        grid_type[boundary_mask] = 0
+        grid_type[inside_mask] = 1
+        # row by row (y-major), same order as scanning the bounding box one cell at a time
+        coordinates = set(zip(xs.T[inside_mask.T].tolist(), ys.T[inside_mask.T].tolist()))
+        tile_count = len(coordinates)
+
+        # edge coordinates are part of the region too
+        coordinates = coordinates.union(all_boundaries)
+        coordinate_array = np.array(list(coordinates), dtype=np.int8)
+
+        return grid_type, all_boundaries, coordinates, tile_count, coordinate_array
+
     def __getitem__(self, key: list or tuple) -> (int, gamelib.GameUnit):
         """
         Overloads [] operator to get tuple from self.grid
@@ -114,7 +185,7 @@ class Region:
 
         return [
             self.grid_type[self.zero_coordinates(key)],
-            self.grid_unit[self.zero_coordinates(key)],
+            self.grid_unit.get(self.zero_coordinates(key)),
         ]
 
     def __setitem__(self, key: list or tuple, value: (int, gamelib.GameUnit)) -> None:
@@ -124,8 +195,12 @@ class Region:
         @param value: Tuple representing information about the region grid at the coordinate
         """
 
-        self.grid_type[key[0] - self.xbounds[0], key[1] - self.ybounds[0]] = value[0]
-        self.grid_unit[key[0] - self.xbounds[0], key[1] - self.ybounds[0]] = value[1]
+        zeroed = self.zero_coordinates(key)
+        self.grid_type[zeroed] = value[0]
+        if value[1] is None:
+            self.grid_unit.pop(zeroed, None)
+        else:
+            self.grid_unit[zeroed] = value[1]
 
     def in_bounds(self, coords: tuple or list) -> bool:
         """
@@ -149,7 +224,10 @@ class Region:
         @return: True if it is, false otherwise
         """
 
-        return self[coords][0] == 0
+        return (
+            self.grid_type[coords[0] - self.xbounds[0], coords[1] - self.ybounds[0]]
+            == 0
+        )
 
     def on_inside(self, coords: tuple or list) -> bool:
         """
@@ -158,44 +236,30 @@ class Region:
         @return: True if it is, false otherwise
         """
 
-        return self[coords][0] == 1
+        return (
+            self.grid_type[coords[0] - self.xbounds[0], coords[1] - self.ybounds[0]]
+            == 1
+        )
 
-    def edge_coordinates(self, edge: (list or tuple, list or tuple)) -> list:
+    def edge_coordinates(self, edge: (list or tuple, list or tuple)) -> np.ndarray:
         """
         Calculates the lattice points along the edge
         @param edge: tuple of (x, y) coordinates denoting endpoints of the edge
-        @return: list of lattice points along the edge
+        @return: (N, 2) array of lattice points along the edge
         """
 
-        start = edge[0]
-        finish = edge[1]
-        if finish[0] < start[0]:
-            start, finish = finish, start
-
-        # if the line is vertical
-        if start[0] == finish[0]:
-            return [
-                (start[0], min(start[1], finish[1]) + i)
-                for i in range(abs(finish[1] - start[1]) + 1)
-            ]
-
-        # line is horizontal
-        if start[1] == finish[1]:
-            return [
-                (min(start[0], finish[0]) + i, start[1])
-                for i in range(abs(finish[0] - start[0]) + 1)
-            ]
+        # walk from the lower left endpoint, one step per lattice point along the longer axis
+        # the other axis is rounded to the nearest lattice point with integer math (Bresenham),
+        # which is exact for straight and 45 degree edges
+        start, finish = sorted((tuple(edge[0]), tuple(edge[1])))
+        dx, dy = finish[0] - start[0], finish[1] - start[1]
+        count = max(dx, abs(dy))
+        steps = np.arange(count + 1)
+        n = max(count, 1)
+        xs = start[0] + (2 * dx * steps + n) // (2 * n)
+        ys = start[1] + (2 * dy * steps + n) // (2 * n)
 
-        # line is upwards sloping
-        if finish[1] - start[1] > 0:
-            return [
-                (start[0] + i, start[1] + i) for i in range(finish[1] - start[1] + 1)
-            ]
-        # line is downward sloping
-        else:
-            return [
-                (start[0] + i, start[1] - i) for i in range(start[1] - finish[1] + 1)
-            ]
+        return np.stack([xs, ys], axis=1)
 
     def update_structures(self, unit_enum_map: dict, map: gamelib.GameMap) -> None:
         """
@@ -210,26 +274,17 @@ class Region:
             unit_enum_map["WALL"]: [],
         }
 
-        # iterate through each valid tile inside the triangle to see what structure is in it
-        for coord in self.coordinates:
-            if self.grid_type[self.zero_coordinates(coord)] == -1:
-                continue
-
-            unit = map[coord[0], coord[1]]
-            if not unit:
-                self[coord[0], coord[1]][1] = None
-                continue
-
-            unit = unit[0]
-            if unit.unit_type == unit_enum_map["TURRET"]:
-                self.units[unit.unit_type].append(unit)
-                self.grid_unit[self.zero_coordinates(coord)] = unit
-            elif unit.unit_type == unit_enum_map["FACTORY"]:
-                self.units[unit.unit_type].append(unit)
-                self.grid_unit[self.zero_coordinates(coord)] = unit
-            elif unit.unit_type == unit_enum_map["WALL"]:
-                self.units[unit.unit_type].append(unit)
-                self.grid_unit[self.zero_coordinates(coord)] = unit
+        # look up which tiles of the region hold a structure all at once, then only visit those
+        _, structure_types = map.get_structure_arrays()
+        occupied = (
+            structure_types[self.coordinate_array[:, 0], self.coordinate_array[:, 1]]
+            >= 0
+        )
+        self.grid_unit = {}
+        for x, y in self.coordinate_array[occupied].tolist():
+            unit = map[x, y][0]
+            self.units[unit.unit_type].append(unit)
+            self.grid_unit[(x - self.xbounds[0], y - self.ybounds[0])] = unit
 
         self.recalculate_paths = True
 
@@ -257,15 +312,37 @@ class Region:
         if game_map is None:
             return
 
-        for turret in self.units[unit_enum_map["TURRET"]]:
-            for coord in game_map.get_locations_in_range(
-                (turret.x, turret.y), turret.attackRange
-            ):
-                if (
-                    self.xbounds[1] >= coord[0] >= self.xbounds[0]
-                    and self.ybounds[1] >= coord[1] >= self.ybounds[0]
-                ):
-                    self.damage_regions[self.zero_coordinates(coord)] += turret.damage_i
+        # start from a fresh array, damage_regions may be a view into the whole map's damage from update_damage_regions
+        self.damage_regions = np.zeros(
+            shape=(self.xwidth, self.ywidth), dtype=np.float32
+        )
+        turrets = self.units[unit_enum_map["TURRET"]]
+        if not turrets:
+            return
+
+        # same range test as game_map.get_locations_in_range, but for every turret and coordinate at once
+        # rows are turrets and columns are coordinates, compared squared to skip the sqrt
+        get_hit_radius = game_map.config["unitInformation"][0]["getHitRadius"]
+        turret_xs = np.array([turret.x for turret in turrets])[:, None]
+        turret_ys = np.array([turret.y for turret in turrets])[:, None]
+        reach = np.array([turret.attackRange + get_hit_radius for turret in turrets])
+        damage_i = np.array([turret.damage_i for turret in turrets])
+        xs = self.coordinate_array[:, 0].astype(int)
+        ys = self.coordinate_array[:, 1].astype(int)
+        in_range = (xs - turret_xs) ** 2 + (ys - turret_ys) ** 2 < (reach**2)[:, None]
+
+        self.apply_damage(damage_i @ in_range)
+
+    def apply_damage(self, damage: np.array) -> None:
+        """
+        Adds damage to every coordinate of the region with one indexed add
+        @param damage: array of damage per coordinate, in the same order as coordinate_array
+        """
+
+        self.damage_regions[
+            self.coordinate_array[:, 0] - self.xbounds[0],
+            self.coordinate_array[:, 1] - self.ybounds[0],
+        ] += damage
 
     def zero_coordinates(self, coord: tuple or list) -> (int, int):
         """
@@ -276,42 +353,73 @@ class Region:
 
         return coord[0] - self.xbounds[0], coord[1] - self.ybounds[0]
 
-    def bfs(self, start: tuple or list, visited: np.array, path_dict: dict):
+    def bfs(
+        self,
+        start: tuple or list,
+        visited: np.array,
+        path_dict: dict,
+        cell_types: list = None,
+    ):
         """
         Breadth First Search based pathfinding algorithm between any given point and the edges of the region
         @param start: (x, y) coordinate to start bfs from
-        @param visited: boolean array keeping track of which places have already been seen
+        @param visited: boolean array keeping track of which places have already been seen, or None to start fresh
         @param path_dict: dictionary containing all of the paths between two edge points
+        @param cell_types: Optional: flat list of walkable cell types from walkable_cell_types()
         """
 
-        queue = [[list(start)]]
-        visited[self.zero_coordinates(start)] = True
-        while queue:
-            path = queue.pop(0)
-            s = path[-1]
-
-            above = [s[0], s[1] + 1]
-            below = [s[0], s[1] - 1]
-            right = [s[0] + 1, s[1]]
-            left = [s[0] - 1, s[1]]
-
-            adjacents = [above, below, right, left]
-            for adj in adjacents:
-                if (
-                    self.xbounds[0] <= adj[0] <= self.xbounds[1]
-                    and self.ybounds[0] <= adj[1] <= self.ybounds[1]
-                ):
-                    if self[adj][0] >= 0 and not visited[self.zero_coordinates(adj)]:
-                        visited[self.zero_coordinates(adj)] = True
-                    if self[adj][1] is None:
-                        continue
-
-                    if self[adj][0] == 0:
-                        path.append(above)
-                        path_dict[tuple(start)][tuple(adj)] = path
-                        path_dict[tuple(adj)][tuple(start)] = reversed(path)
-                    else:
-                        queue.append([path + above])
+        if cell_types is None:
+            cell_types = self.walkable_cell_types()
+
+        start = tuple(start)
+        if visited is None:
+            flat_visited = [False] * (self.xwidth * self.ywidth)
+        else:
+            flat_visited = visited.ravel().tolist()
+        predecessors, reached_edges = bfs_predecessors(
+            cell_types,
+            self.xwidth,
+            self.ywidth,
+            (start[0] - self.xbounds[0]) * self.ywidth + start[1] - self.ybounds[0],
+            flat_visited,
+        )
+        if visited is not None:
+            visited[:] = np.reshape(flat_visited, visited.shape)
+
+        for edge in reached_edges:
+            # walk the predecessor links back to the start
+            path = []
+            index = edge
+            while index != -1:
+                path.append(
+                    (
+                        index // self.ywidth + self.xbounds[0],
+                        index % self.ywidth + self.ybounds[0],
+                    )
+                )
+                index = predecessors[index]
+            path.reverse()
+            path_dict[start][path[-1]] = path
+            path_dict[path[-1]][start] = path[::-1]
+
+    def walkable_grid(self) -> np.array:
+        """
+        Copies grid_type with the cells that hold a structure marked as not walkable (-1)
+        @return: cell type array indexed by zeroed coordinates
+        """
+
+        cell_types = self.grid_type.copy()
+        for zeroed in self.grid_unit:
+            cell_types[zeroed] = -1
+        return cell_types
+
+    def walkable_cell_types(self) -> list:
+        """
+        Flattens grid_type for bfs, marking cells that hold a structure as not walkable
+        @return: flat list of cell types, index x * ywidth + y in zeroed coordinates
+        """
+
+        return self.walkable_grid().ravel().tolist()
 
     def calculate_paths(self):
         """
@@ -322,14 +430,13 @@ class Region:
         """
 
         if self.recalculate_paths:
-            self.path_dict = {
-                start: {end: [] for end in self.all_boundaries}
-                for start in self.all_boundaries
-            }
+            # only the pairs of edge points bfs actually connects get an entry
+            self.path_dict = defaultdict(dict)
+            cell_types = self.walkable_cell_types()
             for incoming_edge in self.incoming_edges:
-                for entrance in self.edge_coordinates(incoming_edge):
-                    visited = np.full((self.xwidth, self.ywidth), False)
-                    self.bfs(entrance, visited, self.path_dict)
+                for entrance in self.edge_coords[incoming_edge]:
+                    # each search starts fresh, so let bfs use a plain list instead of an array
+                    self.bfs(entrance, None, self.path_dict, cell_types)
 
     def simulate_average_damage(self, unit_enum_map: dict, unit: str) -> float:
         """
@@ -354,7 +461,7 @@ class Region:
             speed = 4
 
         for incoming_edge in self.incoming_edges:
-            for entrance in self.edge_coordinates(incoming_edge):
+            for entrance in self.edge_coords[incoming_edge]:
                 for path in self.path_dict[entrance].values():
                     if path:
                         total_paths += 1
@@ -372,23 +479,40 @@ class Region:
         @param path: list of coordinates (x, y)
         """
 
-        damage = 0
-        for coord in path:
-            damage += self.damage_regions[self.zero_coordinates(coord)] * 1 / unit_speed
+        if not path:
+            return 0
 
-        return damage
+        coords = np.asarray(path)
+        damage = float(
+            self.damage_regions[
+                coords[:, 0] - self.xbounds[0], coords[:, 1] - self.ybounds[0]
+            ].sum()
+        )
 
-    def average_tile_damage(self) -> float:
+        return damage / unit_speed
+
+    def tile_damage(self) -> np.array:
+        """
+        Gathers the damage at every coordinate of the region
+        @return: array of damage per coordinate, in the same order as coordinate_array
+        """
+
+        return self.damage_regions[
+            self.coordinate_array[:, 0] - self.xbounds[0],
+            self.coordinate_array[:, 1] - self.ybounds[0],
+        ]
+
+    def average_tile_damage(self, tile_damage: np.array = None) -> float:
         """
         Calculates the average amount of damage a unit might take on tile
+        @param tile_damage: Optional: damage per coordinate from tile_damage()
         @return: ^^^
         """
 
-        total_damage = 0
-        for coord in self.coordinates:
-            total_damage += self.damage_regions[self.zero_coordinates(coord)]
+        if tile_damage is None:
+            tile_damage = self.tile_damage()
 
-        return total_damage / self.tile_count
+        return float(tile_damage.sum()) / self.tile_count
 
     def calculate_region_cost(
         self,
@@ -422,17 +546,22 @@ class Region:
         """
         Finds random available location to place a turret
         @param state: Game State
-        @return: random available location (x, y) coordinate
+        @return: random available location (x, y) coordinate, None if every tile is taken
         """
 
-        loc = random.choice(list(self.coordinates))
-        while (
-            self.grid_type[self.zero_coordinates(loc)] == -1
-            or self.grid_unit[self.zero_coordinates(loc)] is not None
-        ):
-            loc = random.choice(list(self.coordinates))
+        # mask out occupied cells once and pick among what's left, instead of retrying random picks
+        free = self.coordinate_array[
+            self.walkable_grid()[
+                self.coordinate_array[:, 0] - self.xbounds[0],
+                self.coordinate_array[:, 1] - self.ybounds[0],
+            ]
+            != -1
+        ]
+        if len(free) == 0:
+            return None
 
-        return loc
+        x, y = free[random.randrange(len(free))].tolist()
+        return x, y
 
     def calculate_overall_health(
         self, unit_enum_map: dict, defensive_only: bool = True
@@ -452,36 +581,44 @@ class Region:
 
         return health
 
-    def undefended_tiles(self) -> list:
+    def undefended_tiles(self, tile_damage: np.array = None) -> list:
         """
         Determines which tiles are undefended in the region
+        @param tile_damage: Optional: damage per coordinate from tile_damage()
         @return: list of undefended tile coordinates
         """
 
-        undefended = []
-        for coord in self.coordinates:
-            if self.damage_regions[self.zero_coordinates(coord)] == 0:
-                # This coord is undefended by a turret
-                undefended.append(coord)
+        if tile_damage is None:
+            tile_damage = self.tile_damage()
+
+        # a coordinate is undefended if no turret does damage there
+        undefended = tile_damage == 0
 
-        return undefended
+        return [(x, y) for x, y in self.coordinate_array[undefended].tolist()]
 
     def calculate_region_states(self, unit_enum_map: dict, units: list):
+        # gather the damage under the region once for both damage states
+        tile_damage = self.tile_damage()
+
+        # same totals as calculate_region_cost and calculate_overall_health, from one walk over the units
+        cost_all = cost_def = 0
+        health_all = health_def = 0
+        for region_units in self.units.values():
+            for unit in region_units:
+                cost = (unit.health / unit.max_health) * unit.cost[0]
+                cost_all += cost
+                health_all += unit.health
+                if unit.unit_type != unit_enum_map["FACTORY"]:
+                    cost_def += cost
+                    health_def += unit.health
+
         self.states = {}
-        self.states["AVG TILE DMG"] = self.average_tile_damage()
-        self.states["REGION COST ALL"] = self.calculate_region_cost(
-            unit_enum_map, defensive_only=False
-        )
-        self.states["REGION COST DEF"] = self.calculate_region_cost(
-            unit_enum_map, defensive_only=True
-        )
-        self.states["OVERALL HEALTH ALL"] = self.calculate_overall_health(
-            unit_enum_map, defensive_only=False
-        )
-        self.states["OVERALL HEALTH DEF"] = self.calculate_overall_health(
-            unit_enum_map, defensive_only=True
-        )
-        self.states["UNDEFENDED TILES"] = self.undefended_tiles()
+        self.states["AVG TILE DMG"] = self.average_tile_damage(tile_damage)
+        self.states["REGION COST ALL"] = cost_all
+        self.states["REGION COST DEF"] = cost_def
+        self.states["OVERALL HEALTH ALL"] = health_all
+        self.states["OVERALL HEALTH DEF"] = health_def
+        self.states["UNDEFENDED TILES"] = self.undefended_tiles(tile_damage)
         self.states["TURRET COUNT"] = len(self.units[unit_enum_map["TURRET"]])
         # self.states["SIMULATED DAMAGE"] = {
         #     unit: self.simulate_average_damage(unit_enum_map, unit) for unit in units
@@ -493,34 +630,37 @@ class Region:
         """
         Calculates optimal placement of turret based on the current region state.
         @param unit_enum_map: map describing the enumerations for each unit
+        @param potential_locations: Optional: (x, y) coordinates to choose from, defaults to the whole region
         @return: optimal coordinate for turret placement
         """
 
         if self.units[unit_enum_map["TURRET"]] is None:
             # If no pre-existing turrets, random
-            return random.choice(self.edge_coordinates(self.incoming_edges[0]))
+            return random.choice(self.edge_coords[self.incoming_edges[0]])
 
         if potential_locations is None:
-            potential_locations = self.coordinates
-        # Otherwise, find location maximizing distance from all other turrets
-        best_candidate = list(self.coordinates)[0]
-        distance_from_other_turrets = 0
-        for coord in potential_locations:
-            if (
-                self.grid_unit[self.zero_coordinates(coord)] is not None
-                or self.grid_type[self.zero_coordinates(coord)] == 0
-            ):
-                continue
+            potential_locations = self.coordinate_array
+        # only empty cells inside the region (not on its edges) are candidates
+        candidates = np.array(list(potential_locations), dtype=int).reshape(-1, 2)
+        candidates = candidates[
+            self.walkable_grid()[
+                candidates[:, 0] - self.xbounds[0], candidates[:, 1] - self.ybounds[0]
+            ]
+            == 1
+        ]
+        if len(candidates) == 0:
+            return next(iter(self.coordinates))
 
-            # Maxmize distanced to ALL turrets
-            dist = sum(
-                math.sqrt((turret.x - coord[0]) ** 2 + (turret.y - coord[1]) ** 2)
-                for turret in self.units[unit_enum_map["TURRET"]]
-            )
-            if dist > distance_from_other_turrets:
-                best_candidate = coord
+        # Otherwise, find location maximizing distance from all other turrets
+        # rows are candidates and columns are turrets, summing each candidate's distance to ALL turrets
+        turrets = self.units[unit_enum_map["TURRET"]]
+        turret_coords = np.array([(turret.x, turret.y) for turret in turrets]).reshape(-1, 2)
+        distances = np.sqrt(
+            ((candidates[:, None, :] - turret_coords[None, :, :]) ** 2).sum(axis=2)
+        ).sum(axis=1)
 
-        return best_candidate
+        x, y = candidates[distances.argmax()].tolist()
+        return x, y
 
     def calculate_optimal_turret_upgrade(self, unit_enum_map: dict) -> (int, int):
         """
@@ -637,28 +777,30 @@ class Region:
                 if not wall.upgraded:
                     game_state.attempt_upgrade([wall.x, wall.y])
 
-    def point_inside_polygon(self, x: int, y: int, poly: list) -> bool:
+    def point_inside_polygon(self, x, y, poly: list):
         """
-        Checks to see if an x,y coordinate is inside of a polygon
-        @param x: x coordinate
-        @param y: coordinate
+        Checks to see if x,y coordinates are inside of a polygon
+        @param x: x coordinate, or numpy array of x coordinates
+        @param y: y coordinate, or numpy array of y coordinates (same shape as x)
         @param poly: list of vertices representing the convex polygon
-        @return: whether the point is in the polygon
+        @return: whether the point is in the polygon (boolean array if x and y are arrays)
         """
 
+        x = np.asarray(x)
+        y = np.asarray(y)
         n = len(poly)
-        inside = False
+        inside = np.zeros(np.broadcast(x, y).shape, dtype=bool)
 
         p1x, p1y = poly[0]
         for i in range(n + 1):
             p2x, p2y = poly[i % n]
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
+            # horizontal edges can never satisfy both y bounds, so they're skipped
+            if p1y != p2y:
+                crosses = (y > min(p1y, p2y)) & (y <= max(p1y, p2y)) & (x <= max(p1x, p2x))
+                if p1x != p2x:
+                    xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+                    crosses &= x <= xinters
+                inside ^= crosses
             p1x, p1y = p2x, p2y
 
-        return inside
+        return inside if inside.ndim else bool(inside)
@@ -96,6 +96,8 @@ class AlgoStrategy(gamelib.AlgoCore):
             "DEMOLISHER": DEMOLISHER,
             "INTERCEPTOR": INTERCEPTOR,
         }
+        # damage of a single turret, only depends on the config so it's read once
+        self.turret_damage_i = gamelib.GameUnit(TURRET, config).damage_i
 
         self.our_defense = Defense(self.UNIT_ENUM_MAP, 0)
         self.their_defense = Defense(self.UNIT_ENUM_MAP, 1)
@@ -454,6 +456,8 @@ class AlgoStrategy(gamelib.AlgoCore):
         estimate the path's damage risk.
         """
         damages = []
+        get_attackers = game_state.get_attackers
+        turret_damage_i = self.turret_damage_i
         # Get the damage estimate each path will take
         for location in location_options:
             path = game_state.find_path_to_edge(location)
@@ -462,10 +466,7 @@ class AlgoStrategy(gamelib.AlgoCore):
             damage = 0
             for path_location in path:
                 # Get number of enemy turrets that can attack each location and multiply by turret damage
-                damage += (
-                    len(game_state.get_attackers(path_location, 0))
-                    * gamelib.GameUnit(TURRET, game_state.config).damage_i
-                )
+                damage += len(get_attackers(path_location, 0)) * turret_damage_i
             damages.append(damage)
 
         # Now just return the location that takes the least damage
@@ -31,14 +31,14 @@ class OffensiveInterceptorSpam:
             built (int): Number of Interceptors actually successfully placed
         """
 
-        built = 0  # To return
+        # Flatten the stacks into one spawn call, which checks each placement itself
+        stacked_locations = [loc for loc in locations for _ in range(num_interceptors)]
+        if not stacked_locations:
+            return 0
 
-        for loc in locations:
-            built += self.build_interceptor_spam_single_loc(
-                game_state, unit_enum_map, num_interceptors, loc
-            )
-
-        return built
+        return game_state.attempt_spawn(
+            unit_enum_map["INTERCEPTOR"], stacked_locations
+        )
 
     def build_interceptor_spam_single_loc(
         self,
@@ -59,37 +59,12 @@ class OffensiveInterceptorSpam:
             built (int): Number of Interceptors actually successfully placed
         """
 
-        built = 0  # To return
-
-        for _ in range(num_interceptors):
-            if self._build_interceptor_helper(game_state, unit_enum_map, location):
-                built += 1
-
-        return built
-
-    def _build_interceptor_helper(
-        self,
-        game_state: GameState,
-        unit_enum_map: dict,
-        location: (int, int) or [[int]],
-    ) -> bool:
-        """Private helper to place an interceptor at a given location
-
-        Args:
-            game_state (GameState): The current GameState object
-            unit_enum_map (dict): Maps NAME to unit enum
-            location (int, int) or [int]: The (x, y) or [x, y] coordinates to place it at
-
-        Returns:
-            is_successful (bool): Whether the interceptor was able to be placed
-        """
-
-        if not game_state.can_spawn(unit_enum_map["INTERCEPTOR"], location):
-            return False
-
-        built = game_state.attempt_spawn(unit_enum_map["INTERCEPTOR"], location)
+        if num_interceptors < 1:
+            return 0
 
-        return True if built == 1 else False
+        return game_state.attempt_spawn(
+            unit_enum_map["INTERCEPTOR"], location, num_interceptors
+        )
 
 
 class OffensiveDemolisherLine:
@@ -114,22 +89,29 @@ class OffensiveDemolisherLine:
             bool (int): Whether this strategy was successfully executed
         """
 
-        # Build a full line towards right of location (might overflow but fine)
-        wall_num = 0
+        # Build a full line towards right of location, stopping at the row's right edge
+        # (x = 14 + y on our side) instead of probing off-board tiles
+        row_length = max(0, game_state.HALF_ARENA + location[1] - location[0] + 1)
         wall_num = DefensiveWallStrat().build_h_wall_line(
-            game_state, unit_enum_map, location, game_state.ARENA_SIZE, right=True
+            game_state, unit_enum_map, location, row_length, right=True
         )
 
         # Build demolishers 1 tile behind
         dem_y = location[1] - 1
-        dem_x = 14 + dem_y  # Start from the right-most possible place for this row
-        while not game_state.can_spawn(unit_enum_map["DEMOLISHER"], [dem_x, dem_y]):
-            dem_x -= 1  # Find a suitable place to stack (iteratively go left)
-
-        dem_num = 0
-        for _ in range(game_state.number_affordable(unit_enum_map["DEMOLISHER"])):
-            dem_num += game_state.attempt_spawn(
-                unit_enum_map["DEMOLISHER"], [dem_x, dem_y]
+        # Mobile units only spawn on edge tiles, so the row has exactly two
+        # candidates: the bottom-right edge (x = 14 + y), then the bottom-left
+        # edge (x = 13 - y)
+        for dem_x in (14 + dem_y, 13 - dem_y):
+            if game_state.can_spawn(unit_enum_map["DEMOLISHER"], [dem_x, dem_y]):
+                break
+        else:
+            return False
+
+        # Stack every affordable demolisher in a single spawn call
+        dem_num = game_state.number_affordable(unit_enum_map["DEMOLISHER"])
+        if dem_num > 0:
+            dem_num = game_state.attempt_spawn(
+                unit_enum_map["DEMOLISHER"], [dem_x, dem_y], dem_num
             )
 
         # TODO - Delete walls that allow us to enter regions